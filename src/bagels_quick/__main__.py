@@ -0,0 +1,6 @@
+"""Support `python -m bagels_quick` as an alternative to the bq script."""
+
+from bagels_quick.cli import cli
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,402 @@
+"""Database and config helpers shared by the bq subcommands.
+
+Only imported once a subcommand actually runs; the entry shim in
+cli.py stays free of sqlite3, json and rich so `bq --help` pays for
+none of them.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import click
+
+try:
+    import orjson  # C-accelerated JSON parser; optional
+except ImportError:
+    orjson = None
+
+# Default paths
+DEFAULT_DB_PATH = Path.home() / ".local" / "share" / "bagels" / "db.db"
+CONFIG_PATH = Path.home() / ".config" / "bagels-quick" / "config.json"
+
+class _LazyConsole:
+    """Defer the rich import and Console construction to first use.
+
+    Importing rich costs tens of milliseconds of startup; commands that
+    never print through it shouldn't pay for it. Together with the
+    in-function `from rich.table import Table` imports in the table
+    commands, this keeps rich entirely out of any invocation that never
+    renders through it.
+    """
+
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
+
+
+def emit_plain(rows) -> None:
+    """Write rows of strings as tab-joined lines via click.echo.
+
+    The pipe path for the table commands: Rich buffers every row to
+    compute column widths before rendering, which is wasted work when
+    output is headed for grep or a file. Plain lines stream row by row
+    and keep Rich out of the process entirely.
+    """
+    for row in rows:
+        click.echo("\t".join(row))
+
+
+# =============================================================================
+# Config Management
+# =============================================================================
+
+# Parsed config cached against the file's mtime so repeated get_config()
+# calls in one invocation cost a single stat instead of a read + parse.
+_config_cache: tuple[int, dict] | None = None
+
+
+def get_config() -> dict:
+    """Load config from file, or return defaults."""
+    global _config_cache
+    defaults = {
+        "default_account": None,      # Account name to use by default
+        "default_category": None,     # Category name to use by default
+        "confirm_undo": True,         # Ask before deleting
+        "show_balance_after_add": False,  # Show account balance after adding
+    }
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return defaults
+    if _config_cache is not None and _config_cache[0] == mtime:
+        # Shallow copy so callers that mutate their cfg (config set)
+        # can't poison the cache for the rest of the process.
+        return dict(_config_cache[1])
+    try:
+        data = CONFIG_PATH.read_bytes()
+        saved = orjson.loads(data) if orjson else json.loads(data)
+        defaults.update(saved)
+    except (ValueError, IOError):
+        pass
+    # The setters only ever store str or None for the default keys;
+    # coerce anything a hand-edited file smuggled in so display code
+    # can rely on the invariant.
+    for key in ("default_account", "default_category"):
+        if defaults[key] is not None and not isinstance(defaults[key], str):
+            defaults[key] = str(defaults[key])
+    _config_cache = (mtime, defaults)
+    return dict(defaults)
+
+
+def save_config(config: dict) -> None:
+    """Save config to file atomically."""
+    global _config_cache
+    CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Serialize to one compact buffer and write it in a single syscall,
+    # then replace into place so a crash can never leave a torn file.
+    data = json.dumps(config, separators=(",", ":")).encode()
+    tmp = CONFIG_PATH.with_suffix(".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, CONFIG_PATH)
+    # Refresh the cache from what was just written, sparing the next
+    # get_config() a re-read.
+    _config_cache = (CONFIG_PATH.stat().st_mtime_ns, dict(config))
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached config; used when the file is removed outright."""
+    global _config_cache
+    _config_cache = None
+
+
+# =============================================================================
+# Database Helpers
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def get_db_path() -> Path:
+    """Get the Bagels database path."""
+    if DEFAULT_DB_PATH.exists():
+        return DEFAULT_DB_PATH
+    checked = [DEFAULT_DB_PATH]
+    if sys.platform == "win32":
+        # The AppData fallback only exists on Windows; skip the stat elsewhere.
+        win_path = Path.home() / "AppData" / "Local" / "bagels" / "db.db"
+        if win_path.exists():
+            return win_path
+        checked.append(win_path)
+    checked_str = "\n  ".join(str(p) for p in checked)
+    raise click.ClickException(
+        f"Bagels database not found. Checked:\n  {checked_str}\n"
+        "Run 'bagels locate database' to find your database."
+    )
+
+
+# Lazily opened shared connections, one per mode. Opening a connection
+# and negotiating pragmas is a fixed cost worth paying once per process;
+# atexit owns the close so command bodies don't have to.
+_connections: dict[bool, sqlite3.Connection] = {}
+
+
+def get_connection(readonly: bool = False) -> sqlite3.Connection:
+    """Get a database connection.
+
+    Pure-SELECT command paths should pass readonly=True: the database is
+    opened in URI read-only mode, which skips journal and write-lock
+    setup on open. The connection is opened once per mode and reused for
+    the life of the process.
+    """
+    conn = _connections.get(readonly)
+    if conn is not None:
+        return conn
+    conn = _open_connection(readonly)
+    _connections[readonly] = conn
+    atexit.register(conn.close)
+    return conn
+
+
+def _open_connection(readonly: bool) -> sqlite3.Connection:
+    db_path = get_db_path()
+    # cached_statements keys on the exact SQL text, so the hot-path
+    # queries below are kept as module-level constants to stay cacheable.
+    if readonly:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, cached_statements=128)
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+    conn = sqlite3.connect(str(db_path), cached_statements=128)
+    try:
+        # WAL is persistent per database file; only switch when needed so
+        # repeat opens don't take the exclusive lock the change requires.
+        if conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            conn.execute("PRAGMA journal_mode=WAL")
+        # One fsync per commit instead of two; safe under WAL.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=134217728")
+        conn.execute("PRAGMA cache_size=-8000")
+        conn.execute("PRAGMA busy_timeout=5000")
+    except sqlite3.OperationalError:
+        pass
+    # Partial NOCASE indexes so name lookups are seeks instead of scans.
+    # Only live rows are indexed, matching every WHERE clause in this module.
+    # The NOCASE collation must match the COLLATE NOCASE comparisons in the
+    # lookup queries, which is what lets the planner use these at all.
+    try:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_category_name "
+            "ON category(name COLLATE NOCASE) WHERE deletedAt IS NULL"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_account_name "
+            "ON account(name COLLATE NOCASE) WHERE deletedAt IS NULL"
+        )
+        # Covering indexes for the balance sums and the createdAt-ordered
+        # lookups in undo/edit, so they seek instead of scanning record.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_record_acc_flags "
+            "ON record(accountId, isTransfer, isIncome)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_record_xferto "
+            "ON record(transferToAccountId) WHERE isTransfer = 1"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_record_created "
+            "ON record(createdAt DESC)"
+        )
+        conn.commit()
+    except sqlite3.OperationalError:
+        # Read-only database; lookups still work, just unindexed.
+        pass
+    return conn
+
+
+# The prefix query covers exact matches too (a name is a prefix of
+# itself) and is seekable with the NOCASE index because the pattern is a
+# bound-parameter prefix expression, never a leading wildcard. The
+# substring form is the unavoidable full-scan fallback.
+_PREFIX_NAME_SQL = """
+    SELECT id, name,
+           CASE WHEN name = ?1 COLLATE NOCASE THEN 0 ELSE 1 END AS rank
+    FROM {table}
+    WHERE name LIKE ?1 || '%' COLLATE NOCASE AND deletedAt IS NULL
+    ORDER BY rank, name
+"""
+
+_SUBSTR_NAME_SQL = """
+    SELECT id, name, 2 AS rank
+    FROM {table}
+    WHERE name LIKE '%' || ? || '%' COLLATE NOCASE AND deletedAt IS NULL
+    ORDER BY name
+"""
+
+# Interpolated once at import so the SQL text is byte-for-byte stable and
+# hits the connection's statement cache on every call.
+_NAME_SQL = {
+    table: (
+        _PREFIX_NAME_SQL.format(table=table),
+        _SUBSTR_NAME_SQL.format(table=table),
+    )
+    for table in ("category", "account")
+}
+
+# Exact-name lookup table per (connection, table): one SELECT of live
+# names builds a dict keyed on the lowercased name, so every exact
+# resolution after the first (e.g. transfer's two accounts) is a hash
+# probe instead of a query. Keyed on id(conn) so it naturally resets
+# with each new connection.
+_name_cache: dict[tuple[int, str], dict[str, tuple[int, str]]] = {}
+
+
+def _names_by_lower(conn: sqlite3.Connection, table: str) -> dict[str, tuple[int, str]]:
+    key = (id(conn), table)
+    names = _name_cache.get(key)
+    if names is None:
+        cursor = conn.execute(
+            f"SELECT id, name FROM {table} WHERE deletedAt IS NULL"
+        )
+        names = {name.lower(): (row_id, name) for row_id, name in cursor}
+        _name_cache[key] = names
+    return names
+
+
+# Reusable cursors keyed on (connection, SQL text). The connection's own
+# statement cache already avoids re-parsing, but a pinned cursor also
+# skips the per-call cursor allocation and cache probe for the lookup
+# queries, which run on nearly every command.
+_stmt_cache: dict[tuple[int, str], sqlite3.Cursor] = {}
+
+
+def _cached_cursor(conn: sqlite3.Connection, sql: str) -> sqlite3.Cursor:
+    key = (id(conn), sql)
+    cursor = _stmt_cache.get(key)
+    if cursor is None:
+        cursor = conn.cursor()
+        _stmt_cache[key] = cursor
+    return cursor
+
+
+def _find_by_name(
+    conn: sqlite3.Connection, table: str, label: str, search: str
+) -> tuple[int, str] | None:
+    """Find a row by name, ranked by match quality.
+
+    Rank 0 is an exact match, 1 a prefix match, 2 a substring match.
+    An exact match always wins; otherwise a unique match at the best
+    rank is returned, and multiple matches at that rank are ambiguous.
+    The seekable exact/prefix query runs first; the substring scan only
+    runs when it comes back empty.
+    """
+    hit = _names_by_lower(conn, table).get(search.lower())
+    if hit is not None:
+        return hit
+    prefix_sql, substr_sql = _NAME_SQL[table]
+    # Single characters or pure punctuation would substring-match huge
+    # swathes of the table; only an exact match makes sense for those,
+    # and the cache above has already ruled that out.
+    if len(search) < 2 or not any(c.isalnum() for c in search):
+        return None
+    cursor = _cached_cursor(conn, prefix_sql)
+    cursor.execute(prefix_sql, (search,))
+    # Two rows are enough to tell unique from ambiguous; don't
+    # materialize every match for a popular substring.
+    results = cursor.fetchmany(2)
+    if not results:
+        cursor = _cached_cursor(conn, substr_sql)
+        cursor.execute(substr_sql, (search,))
+        results = cursor.fetchmany(2)
+        sql = substr_sql
+    else:
+        sql = prefix_sql
+    if not results:
+        return None
+    best = results[0]
+    if best[2] == 0:
+        return best[:2]
+    if len(results) == 1 or results[1][2] > best[2]:
+        return best[:2]
+    # Ambiguous: re-run only to build the error message.
+    cursor.execute(sql, (search,))
+    names = ", ".join(r[1] for r in cursor.fetchmany(10) if r[2] == best[2])
+    raise click.ClickException(
+        f"Multiple {label} match '{search}': {names}\nBe more specific."
+    )
+
+
+def find_category(conn: sqlite3.Connection, search: str) -> tuple[int, str] | None:
+    """Find a category by name (case-insensitive, partial match)."""
+    return _find_by_name(conn, "category", "categories", search)
+
+
+def find_account(conn: sqlite3.Connection, search: str) -> tuple[int, str] | None:
+    """Find an account by name (case-insensitive, partial match)."""
+    return _find_by_name(conn, "account", "accounts", search)
+
+
+def get_default_account(conn: sqlite3.Connection, config: dict | None = None) -> tuple[int, str]:
+    """Get the default account (from config, or first non-outside account)."""
+    if config is None:
+        config = get_config()
+    if config["default_account"]:
+        result = find_account(conn, config["default_account"])
+        if result:
+            return result
+
+    cursor = conn.cursor()
+    # Sort 'Outside source' last so it is only picked when it is the
+    # sole remaining account; one query instead of a two-step fallback.
+    cursor.execute(
+        "SELECT id, name FROM account WHERE deletedAt IS NULL "
+        "ORDER BY (name = 'Outside source'), id LIMIT 1"
+    )
+    result = cursor.fetchone()
+    if result:
+        return result
+    raise click.ClickException("No accounts found. Create one in Bagels first.")
+
+
+def get_default_category(conn: sqlite3.Connection, config: dict | None = None) -> tuple[int, str] | None:
+    """Get the default category from config."""
+    if config is None:
+        config = get_config()
+    if config["default_category"]:
+        return find_category(conn, config["default_category"])
+    return None
+_ACCOUNT_BALANCE_SQL = """
+    SELECT
+        COALESCE(SUM(CASE WHEN accountId = ?1 AND isIncome = 1 AND isTransfer = 0 THEN amount END), 0),
+        COALESCE(SUM(CASE WHEN accountId = ?1 AND isIncome = 0 AND isTransfer = 0 THEN amount END), 0),
+        COALESCE(SUM(CASE WHEN accountId = ?1 AND isTransfer = 1 THEN amount END), 0),
+        COALESCE(SUM(CASE WHEN transferToAccountId = ?1 THEN amount END), 0)
+    FROM record
+    WHERE accountId = ?1 OR transferToAccountId = ?1
+"""
+
+
+def calculate_account_balance(conn: sqlite3.Connection, account_id: int, beginning_balance: float) -> float:
+    """Calculate current balance for an account."""
+    cursor = conn.cursor()
+    # One pass over record computes all four sums: income, expenses,
+    # transfers out, and transfers in.
+    cursor.execute(_ACCOUNT_BALANCE_SQL, (account_id,))
+    income, expenses, transfers_out, transfers_in = cursor.fetchone()
+    return beginning_balance + income - expenses - transfers_out + transfers_in
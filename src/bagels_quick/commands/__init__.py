@@ -0,0 +1 @@
+"""The bq subcommands, one module per command, imported lazily by cli.py."""
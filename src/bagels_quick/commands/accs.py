@@ -0,0 +1,241 @@
+"""The `bq accs` command group."""
+
+import sys
+from datetime import datetime
+
+import click
+
+from bagels_quick._core import (
+    calculate_account_balance,
+    console,
+    emit_plain,
+    find_account,
+    get_connection,
+)
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def accs(ctx):
+    """Manage accounts.
+
+    \b
+    EXAMPLES:
+      bq accs                              # List all accounts
+      bq accs add "Savings" -b 1000        # Create new account
+      bq accs delete savings               # Delete an account
+      bq accs set debit 5000               # Set balance to exact amount
+      bq accs adjust debit 100             # Adjust balance by amount
+    """
+    if ctx.invoked_subcommand is None:
+        # Default behavior: list accounts
+        conn = get_connection(readonly=True)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT name, description, beginningBalance
+            FROM account
+            WHERE deletedAt IS NULL
+            ORDER BY id
+            """
+        )
+        accounts = cursor.fetchall()
+
+        if not sys.stdout.isatty():
+            emit_plain(
+                (name, desc or "-", f"{balance:,.2f}")
+                for name, desc, balance in accounts
+            )
+            return
+
+        from rich.table import Table
+
+        table = Table(title="Accounts")
+        table.add_column("Name")
+        table.add_column("Description", style="dim")
+        table.add_column("Starting Balance", justify="right")
+
+        for name, desc, balance in accounts:
+            table.add_row(name, desc or "-", f"{balance:,.2f}")
+
+        console.print(table)
+
+
+@accs.command("add")
+@click.argument("name")
+@click.option("-d", "--desc", "--description", "description", help="Account description")
+@click.option("-b", "--balance", "starting_balance", type=float, default=0.0, help="Starting balance (default: 0)")
+def accs_add(name: str, description: str | None, starting_balance: float):
+    """Create a new account.
+
+    \b
+    EXAMPLES:
+      bq accs add "Savings"                    # Create with 0 balance
+      bq accs add "Credit Card" -b -500        # Create with negative balance
+      bq accs add "Cash" -d "Physical cash" -b 200
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    # Check if account already exists
+    cursor.execute(
+        "SELECT id FROM account WHERE LOWER(name) = LOWER(?) AND deletedAt IS NULL",
+        (name,)
+    )
+    if cursor.fetchone():
+        raise click.ClickException(f"Account '{name}' already exists.")
+
+    now = datetime.now()
+    cursor.execute(
+        """
+        INSERT INTO account (createdAt, updatedAt, name, description, beginningBalance, hidden)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (now, now, name, description, starting_balance, False)
+    )
+    conn.commit()
+
+    console.print(f"[green]Created account:[/green] [bold]{name}[/bold]")
+    if starting_balance != 0:
+        console.print(f"Starting balance: {starting_balance:,.2f}")
+
+
+@accs.command("delete")
+@click.argument("account")
+@click.option("-y", "--yes", is_flag=True, help="Skip confirmation")
+def accs_delete(account: str, yes: bool):
+    """Delete an account (soft delete).
+
+    \b
+    EXAMPLES:
+      bq accs delete savings
+      bq accs delete "Old Account" -y    # Skip confirmation
+    """
+    conn = get_connection()
+    acc_result = find_account(conn, account)
+    if not acc_result:
+        raise click.ClickException(f"Account '{account}' not found.")
+    acc_id, acc_name = acc_result
+
+    # Check if account has records
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT COUNT(*) FROM record WHERE accountId = ? OR transferToAccountId = ?",
+        (acc_id, acc_id)
+    )
+    record_count = cursor.fetchone()[0]
+
+    if record_count > 0:
+        console.print(f"[yellow]Warning:[/yellow] Account '{acc_name}' has {record_count} associated records.")
+
+    if not yes:
+        if not click.confirm(f"Delete account '{acc_name}'?"):
+            console.print("[dim]Cancelled.[/dim]")
+            return
+
+    # Soft delete
+    now = datetime.now()
+    cursor.execute(
+        "UPDATE account SET deletedAt = ?, updatedAt = ? WHERE id = ?",
+        (now, now, acc_id)
+    )
+    conn.commit()
+
+    console.print(f"[green]Deleted account:[/green] {acc_name}")
+
+
+@accs.command("set")
+@click.argument("account")
+@click.argument("amount", type=float)
+def accs_set(account: str, amount: float):
+    """Set an account's balance to a specific amount.
+
+    This adjusts the starting balance so current balance equals the target.
+
+    \b
+    EXAMPLES:
+      bq accs set debit 5000       # Set debit balance to exactly 5000
+      bq accs set savings 10000    # Set savings balance to 10000
+    """
+    conn = get_connection()
+    # Immediate transaction so the balance read and the adjustment
+    # write can't be interleaved by a concurrent writer.
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        acc_result = find_account(conn, account)
+        if not acc_result:
+            raise click.ClickException(f"Account '{account}' not found. Run 'bq accs' to see available accounts.")
+        acc_id, acc_name = acc_result
+
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT beginningBalance FROM account WHERE id = ?",
+            (acc_id,)
+        )
+        old_beginning = cursor.fetchone()[0]
+
+        # Calculate current balance with old beginning
+        current = calculate_account_balance(conn, acc_id, old_beginning)
+
+        if amount == current:
+            console.print(f"[bold]{acc_name}[/bold] balance already at [green]{amount:,.2f}[/green]")
+            return
+
+        # New beginning = old_beginning + (target - current)
+        new_beginning = old_beginning + (amount - current)
+
+        cursor.execute(
+            "UPDATE account SET beginningBalance = ?, updatedAt = ? WHERE id = ?",
+            (new_beginning, datetime.now(), acc_id)
+        )
+
+    console.print(f"[bold]{acc_name}[/bold] balance set to [green]{amount:,.2f}[/green]")
+    console.print(f"[dim](Starting balance adjusted: {old_beginning:,.2f} -> {new_beginning:,.2f})[/dim]")
+
+
+@accs.command("adjust")
+@click.argument("account")
+@click.argument("amount", type=float)
+def accs_adjust(account: str, amount: float):
+    """Adjust an account's balance by a relative amount.
+
+    Use positive to add, negative to subtract.
+
+    \b
+    EXAMPLES:
+      bq accs adjust debit 100     # Add 100 to debit balance
+      bq accs adjust debit -- -50  # Subtract 50 (use -- before negative)
+    """
+    conn = get_connection()
+    # Immediate transaction so the balance read and the adjustment
+    # write can't be interleaved by a concurrent writer.
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        acc_result = find_account(conn, account)
+        if not acc_result:
+            raise click.ClickException(f"Account '{account}' not found. Run 'bq accs' to see available accounts.")
+        acc_id, acc_name = acc_result
+
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT beginningBalance FROM account WHERE id = ?",
+            (acc_id,)
+        )
+        old_beginning = cursor.fetchone()[0]
+        new_beginning = old_beginning + amount
+
+        cursor.execute(
+            "UPDATE account SET beginningBalance = ?, updatedAt = ? WHERE id = ?",
+            (new_beginning, datetime.now(), acc_id)
+        )
+
+        # Calculate new current balance
+        new_current = calculate_account_balance(conn, acc_id, new_beginning)
+
+    if amount >= 0:
+        adj_str = f"[green]+{amount:,.2f}[/green]"
+    else:
+        adj_str = f"[red]{amount:,.2f}[/red]"
+
+    console.print(f"[bold]{acc_name}[/bold] adjusted by {adj_str}")
+    console.print(f"New balance: [bold]{new_current:,.2f}[/bold]")
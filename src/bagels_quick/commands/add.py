@@ -0,0 +1,99 @@
+"""The `bq add` command."""
+
+from datetime import datetime
+
+import click
+
+from bagels_quick._core import (
+    find_account,
+    find_category,
+    get_config,
+    get_connection,
+    get_default_account,
+    get_default_category,
+)
+
+
+@click.command()
+@click.argument("amount", type=float)
+@click.argument("label")
+@click.option("-c", "--cat", "--category", "category", help="Category name (partial match OK)")
+@click.option("-a", "--acc", "--account", "account", help="Account name (partial match OK)")
+@click.option("-i", "--income", is_flag=True, help="Mark as income instead of expense")
+@click.option("-d", "--date", "record_date", type=click.DateTime(formats=["%Y-%m-%d"]), help="Date (YYYY-MM-DD), defaults to today")
+def add(amount: float, label: str, category: str | None, account: str | None, income: bool, record_date: datetime | None):
+    """Add an expense or income.
+
+    \b
+    FIELDS:
+      AMOUNT    (required)  Transaction amount, must be > 0
+      LABEL     (required)  Description of the transaction
+
+    \b
+    OPTIONS:
+      -c, --category  (optional)  Category name; uses default if configured
+      -a, --account   (optional)  Account name; uses default if not specified
+      -d, --date      (optional)  Date as YYYY-MM-DD; defaults to today
+      -i, --income    (optional)  Flag to mark as income; default is expense
+
+    \b
+    EXAMPLES:
+      bq add 50 "Coffee and snacks" -c food
+      bq add 1500 "Monthly salary" -c salary --income
+      bq add 25.50 "Grab ride" -c taxi -d 2025-01-03
+    """
+    if amount <= 0:
+        raise click.ClickException("Amount must be positive.")
+
+    conn = get_connection()
+    # Load once; both default lookups below share it.
+    cfg = get_config()
+
+    # Resolve account
+    if account:
+        acc_result = find_account(conn, account)
+        if not acc_result:
+            raise click.ClickException(f"Account '{account}' not found. Run 'bq accs' to see available accounts.")
+        account_id, account_name = acc_result
+    else:
+        account_id, account_name = get_default_account(conn, cfg)
+
+    # Resolve category
+    category_id = None
+    category_name = None
+    if category:
+        cat_result = find_category(conn, category)
+        if not cat_result:
+            raise click.ClickException(f"Category '{category}' not found. Run 'bq cats' to see available categories.")
+        category_id, category_name = cat_result
+    else:
+        # Try default category
+        default_cat = get_default_category(conn, cfg)
+        if default_cat:
+            category_id, category_name = default_cat
+
+    # click.DateTime already parsed -d; one now() serves createdAt,
+    # updatedAt and the default record date.
+    now = datetime.now()
+    record_date = record_date or now
+
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        INSERT INTO record (
+            createdAt, updatedAt, label, amount, date,
+            accountId, categoryId, isInProgress, isIncome, isTransfer
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (now, now, label, amount, record_date, account_id, category_id, False, income, False),
+    )
+    conn.commit()
+
+    # One-line confirmation: click's ANSI styling is enough here and
+    # keeps Rich out of the import graph for this command.
+    record_type = click.style("Income", fg="green") if income else click.style("Expense", fg="red")
+    cat_display = f" [{category_name}]" if category_name else ""
+    click.echo(
+        f"{record_type}: {click.style(f'{amount:,.2f}', bold=True)} - {label}{cat_display} "
+        f"({click.style(account_name, dim=True)})"
+    )
@@ -0,0 +1,70 @@
+"""The `bq balance` command."""
+
+import sys
+
+import click
+
+from bagels_quick._core import console, emit_plain, get_connection
+
+# One join-aggregate pass over record computes every account's sums at
+# once, instead of per-account queries in a loop.
+_ALL_BALANCES_SQL = """
+    SELECT a.id, a.name, a.beginningBalance,
+        COALESCE(SUM(CASE WHEN r.accountId = a.id AND r.isIncome = 1 AND r.isTransfer = 0 THEN r.amount END), 0),
+        COALESCE(SUM(CASE WHEN r.accountId = a.id AND r.isIncome = 0 AND r.isTransfer = 0 THEN r.amount END), 0),
+        COALESCE(SUM(CASE WHEN r.accountId = a.id AND r.isTransfer = 1 THEN r.amount END), 0),
+        COALESCE(SUM(CASE WHEN r.transferToAccountId = a.id THEN r.amount END), 0)
+    FROM account a
+    LEFT JOIN record r ON r.accountId = a.id OR r.transferToAccountId = a.id
+    WHERE a.deletedAt IS NULL
+    GROUP BY a.id
+    ORDER BY a.id
+"""
+
+
+@click.command()
+def balance():
+    """Show current account balances."""
+    conn = get_connection(readonly=True)
+    cursor = conn.cursor()
+    cursor.execute(_ALL_BALANCES_SQL)
+    accounts = cursor.fetchall()
+
+    if not sys.stdout.isatty():
+        rows = []
+        total = 0.0
+        for acc_id, name, beginning, income, expenses, t_out, t_in in accounts:
+            current = beginning + income - expenses - t_out + t_in
+            total += current
+            rows.append((name, f"{current:,.2f}", f"{beginning:,.2f}"))
+        rows.append(("Total", f"{total:,.2f}", ""))
+        emit_plain(rows)
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Account Balances")
+    table.add_column("Account")
+    table.add_column("Current Balance", justify="right")
+    table.add_column("Starting Balance", justify="right", style="dim")
+
+    total = 0.0
+    for acc_id, name, beginning, income, expenses, t_out, t_in in accounts:
+        current = beginning + income - expenses - t_out + t_in
+        total += current
+
+        if current >= 0:
+            bal_str = f"[green]{current:,.2f}[/green]"
+        else:
+            bal_str = f"[red]{current:,.2f}[/red]"
+
+        table.add_row(name, bal_str, f"{beginning:,.2f}")
+
+    table.add_section()
+    if total >= 0:
+        total_str = f"[bold green]{total:,.2f}[/bold green]"
+    else:
+        total_str = f"[bold red]{total:,.2f}[/bold red]"
+    table.add_row("[bold]Total[/bold]", total_str, "")
+
+    console.print(table)
@@ -0,0 +1,61 @@
+"""The `bq cats` command."""
+
+import sys
+
+import click
+
+from bagels_quick._core import console, emit_plain, get_connection
+
+
+@click.command()
+@click.option("--flat", is_flag=True, help="Show flat list instead of tree")
+def cats(flat: bool):
+    """List available categories."""
+    conn = get_connection(readonly=True)
+    cursor = conn.cursor()
+
+    if flat:
+        cursor.execute(
+            """
+            SELECT id, name, parentCategoryId, nature
+            FROM category
+            WHERE deletedAt IS NULL
+            ORDER BY parentCategoryId NULLS FIRST, name
+            """
+        )
+        if not sys.stdout.isatty():
+            emit_plain(
+                (f"{'    ' if parent_id else ''}{name}", nature)
+                for _, name, parent_id, nature in cursor
+            )
+            return
+
+        from rich.table import Table
+
+        table = Table(title="Categories")
+        table.add_column("Name")
+        table.add_column("Type", style="dim")
+        for _, name, parent_id, nature in cursor.fetchall():
+            prefix = "    " if parent_id else ""
+            table.add_row(f"{prefix}{name}", nature)
+        console.print(table)
+    else:
+        # The self-join emits rows already ordered for rendering, so
+        # one linear pass suffices; no parent/child grouping dicts.
+        cursor.execute(
+            """
+            SELECT p.name, p.nature, c.name, c.nature
+            FROM category p
+            LEFT JOIN category c
+                ON c.parentCategoryId = p.id AND c.deletedAt IS NULL
+            WHERE p.parentCategoryId IS NULL AND p.deletedAt IS NULL
+            ORDER BY p.name, c.name
+            """
+        )
+        current_parent = None
+        for parent_name, parent_nature, child_name, child_nature in cursor:
+            if parent_name != current_parent:
+                console.print(f"[bold]{parent_name}[/bold] [dim]({parent_nature})[/dim]")
+                current_parent = parent_name
+            if child_name is not None:
+                console.print(f"  - {child_name} [dim]({child_nature})[/dim]")
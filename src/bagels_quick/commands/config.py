@@ -0,0 +1,213 @@
+"""The `bq config` command group."""
+
+import click
+
+from bagels_quick._core import (
+    CONFIG_PATH,
+    console,
+    find_account,
+    find_category,
+    get_config,
+    get_connection,
+    invalidate_config_cache,
+    save_config,
+)
+
+# Accepted spellings for boolean config values; frozensets make the
+# membership test a single hash probe.
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+_FALSY = frozenset(("false", "0", "no", "off"))
+
+
+def _parse_bool(value: str) -> bool | None:
+    """Map a user-supplied boolean string to a bool, or None if invalid."""
+    value = value.lower()
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return None
+
+
+# Each setter takes (cfg, value), mutates cfg when something actually
+# changes, and returns the status message to print; invalid values
+# raise ClickException. config_set dispatches on the table below, so
+# adding a setting is one handler plus one dict entry.
+
+def _set_default_account(cfg: dict, value: str) -> str:
+    old = cfg["default_account"]
+    if value.lower() == "none":
+        if old is None:
+            return "[dim]default_account already cleared[/dim]"
+        cfg["default_account"] = None
+        return "Cleared default_account"
+    if old == value:
+        # Already stored under exactly this name; no lookup needed.
+        return f"[dim]default_account already = {old}[/dim]"
+    result = find_account(get_connection(readonly=True), value)
+    if not result:
+        raise click.ClickException(f"Account '{value}' not found. Run 'bq accs' to see available accounts.")
+    if result[1] == old:
+        return f"[dim]default_account already = {old}[/dim]"
+    cfg["default_account"] = result[1]  # Store the actual name
+    return f"Set default_account = [bold]{result[1]}[/bold]"
+
+
+def _set_default_category(cfg: dict, value: str) -> str:
+    old = cfg["default_category"]
+    if value.lower() == "none":
+        if old is None:
+            return "[dim]default_category already cleared[/dim]"
+        cfg["default_category"] = None
+        return "Cleared default_category"
+    if old == value:
+        return f"[dim]default_category already = {old}[/dim]"
+    result = find_category(get_connection(readonly=True), value)
+    if not result:
+        raise click.ClickException(f"Category '{value}' not found. Run 'bq cats' to see available categories.")
+    if result[1] == old:
+        return f"[dim]default_category already = {old}[/dim]"
+    cfg["default_category"] = result[1]
+    return f"Set default_category = [bold]{result[1]}[/bold]"
+
+
+def _make_bool_setter(key: str):
+    def setter(cfg: dict, value: str) -> str:
+        parsed = _parse_bool(value)
+        if parsed is None:
+            raise click.ClickException("Value must be 'true' or 'false'")
+        shown = "[green]true[/green]" if parsed else "[red]false[/red]"
+        if cfg[key] == parsed:
+            return f"[dim]{key} already = {shown}[/dim]"
+        cfg[key] = parsed
+        return f"Set {key} = {shown}"
+    return setter
+
+
+_set_confirm_undo = _make_bool_setter("confirm_undo")
+_set_show_balance_after_add = _make_bool_setter("show_balance_after_add")
+
+_CONFIG_SETTERS = {
+    "default_account": _set_default_account,
+    "default_category": _set_default_category,
+    "confirm_undo": _set_confirm_undo,
+    "show_balance_after_add": _set_show_balance_after_add,
+}
+
+# Derived from the setter table so the error message can never drift
+# from what's actually dispatchable; the join happens once at import.
+_VALID_CONFIG_KEYS = tuple(_CONFIG_SETTERS)
+_UNKNOWN_KEY_TEMPLATE = "Unknown config key '{}'. Valid keys: " + ", ".join(_VALID_CONFIG_KEYS)
+
+
+@click.group()
+def config():
+    """Manage bq configuration.
+
+    \b
+    AVAILABLE SETTINGS:
+      default_account     Account to use when -a is not specified
+      default_category    Category to use when -c is not specified
+      confirm_undo        Whether to ask before deleting (true/false)
+
+    \b
+    EXAMPLES:
+      bq config show                           # Show current config
+      bq config set default_account debit      # Set default account
+      bq config set default_category food      # Set default category
+      bq config set confirm_undo false         # Disable undo confirmation
+      bq config reset                          # Reset to defaults
+    """
+    pass
+
+
+# The layout of config show is static: four settings with fixed labels
+# and descriptions. Interpolating the four values into a prebuilt markup
+# template costs one format call instead of a full Table render.
+_CONFIG_SHOW_TEMPLATE = """\
+[bold]Configuration[/bold]
+  default_account         {default_account}  [dim]Account used when -a not specified[/dim]
+  default_category        {default_category}  [dim]Category used when -c not specified[/dim]
+  confirm_undo            {confirm_undo}  [dim]Ask before deleting entries[/dim]
+  show_balance_after_add  {show_balance_after_add}  [dim]Show account balance after adding[/dim]"""
+
+
+@config.command("show")
+def config_show():
+    """Show current configuration."""
+    cfg = get_config()
+
+    # One print, one render pass and flush, including the file path.
+    console.print(_CONFIG_SHOW_TEMPLATE.format(
+        default_account=cfg["default_account"] or "[dim]not set[/dim]",
+        default_category=cfg["default_category"] or "[dim]not set[/dim]",
+        confirm_undo="[green]true[/green]" if cfg["confirm_undo"] else "[red]false[/red]",
+        show_balance_after_add="[green]true[/green]" if cfg["show_balance_after_add"] else "[red]false[/red]",
+    ) + f"\n\n[dim]Config file: {CONFIG_PATH}[/dim]")
+
+
+@config.command("set")
+@click.argument("key", type=click.Choice(_VALID_CONFIG_KEYS))
+@click.argument("value")
+def config_set(key: str, value: str):
+    """Set a configuration value.
+
+    \b
+    KEYS:
+      default_account     Account name (or 'none' to clear)
+      default_category    Category name (or 'none' to clear)
+      confirm_undo        'true' or 'false'
+    """
+    # click.Choice already validated the key, so a typo fails at parse
+    # time before the config file is ever read.
+    handler = _CONFIG_SETTERS[key]
+    cfg = get_config()
+    before = dict(cfg)
+    console.print(handler(cfg, value))
+    if cfg != before:
+        save_config(cfg)
+
+
+@config.command("set-many")
+@click.argument("pairs", nargs=-1)
+def config_set_many(pairs: tuple[str, ...]):
+    """Set several configuration values in one invocation.
+
+    \b
+    EXAMPLES:
+      bq config set-many default_account debit default_category food
+      bq config set-many confirm_undo false show_balance_after_add true
+    """
+    if not pairs or len(pairs) % 2:
+        raise click.ClickException("Provide key/value pairs: set-many KEY VALUE [KEY VALUE ...]")
+
+    cfg = get_config()
+    before = dict(cfg)
+    # Validate every pair before printing or saving anything, so a bad
+    # key or value part-way through leaves the config untouched.
+    messages = []
+    for key, value in zip(pairs[0::2], pairs[1::2]):
+        handler = _CONFIG_SETTERS.get(key)
+        if handler is None:
+            raise click.ClickException(_UNKNOWN_KEY_TEMPLATE.format(key))
+        messages.append(handler(cfg, value))
+    for msg in messages:
+        console.print(msg)
+    if cfg != before:
+        save_config(cfg)
+
+
+@config.command("reset")
+@click.option("-y", "--yes", is_flag=True, help="Skip confirmation")
+def config_reset(yes: bool):
+    """Reset configuration to defaults."""
+    if not yes:
+        if not click.confirm("Reset all settings to defaults?"):
+            console.print("[dim]Cancelled.[/dim]")
+            return
+
+    # One unlink instead of stat-then-unlink; also closes the window
+    # where the file could vanish between the two calls.
+    CONFIG_PATH.unlink(missing_ok=True)
+    invalidate_config_cache()
+    console.print("[green]Configuration reset to defaults.[/green]")
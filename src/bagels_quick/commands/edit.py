@@ -0,0 +1,164 @@
+"""The `bq edit` command."""
+
+import sqlite3
+from datetime import datetime
+
+import click
+
+from bagels_quick._core import console, find_account, find_category, get_connection
+
+
+@click.command()
+@click.option("-n", "--num", default=1, help="Which entry to edit (1=last, 2=second last, etc.)")
+@click.option("--amount", type=float, help="New amount")
+@click.option("--label", "new_label", help="New label/description")
+@click.option("-c", "--cat", "--category", "category", help="New category")
+@click.option("-a", "--acc", "--account", "account", help="New account")
+@click.option("-d", "--date", "new_date", type=click.DateTime(formats=["%Y-%m-%d"]), help="New date (YYYY-MM-DD)")
+@click.option("--income/--expense", "is_income", default=None, help="Change to income or expense")
+def edit(num: int, amount: float | None, new_label: str | None, category: str | None, account: str | None, new_date: datetime | None, is_income: bool | None):
+    """Edit a recent entry.
+
+    By default edits the last entry. Use -n to edit older entries.
+
+    \b
+    FIELDS (all optional, specify at least one):
+      --amount      New transaction amount (must be > 0)
+      --label       New description text
+      -c, --cat     New category name (partial match OK)
+      -a, --acc     New account name (partial match OK)
+      -d, --date    New date as YYYY-MM-DD
+      --income      Change to income type
+      --expense     Change to expense type
+
+    \b
+    TARGETING:
+      -n, --num     Which entry to edit (1=last, 2=second-last, etc.)
+
+    \b
+    EXAMPLES:
+      bq edit --amount 75                    # Fix amount of last entry
+      bq edit --label "Correct description"  # Fix label
+      bq edit -c groceries                   # Change category
+      bq edit -n 2 --amount 100              # Edit second-to-last entry
+      bq edit --income                       # Change expense to income
+    """
+    if all(v is None for v in [amount, new_label, category, account, new_date, is_income]):
+        raise click.ClickException("Specify at least one field to edit: --amount, --label, -c, -a, -d, --income/--expense")
+
+    conn = get_connection()
+    # One immediate transaction covers the read, the update and the
+    # re-read: a single commit fsync, and no window for a concurrent
+    # writer to slip in between them. The context manager commits on
+    # success and rolls back on error.
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT r.id, r.label, r.amount, r.date, r.isIncome, r.categoryId, r.accountId, c.name, a.name
+            FROM record r
+            LEFT JOIN category c ON r.categoryId = c.id
+            LEFT JOIN account a ON r.accountId = a.id
+            ORDER BY r.createdAt DESC
+            LIMIT 1 OFFSET ?
+            """,
+            (num - 1,)
+        )
+        record = cursor.fetchone()
+
+        if not record:
+            console.print(f"[dim]No record found at position {num}.[/dim]")
+            return
+
+        record_id, old_label, old_amount, old_date, old_is_income, old_cat_id, old_acc_id, old_cat_name, acc_name = record
+
+        # Only fields whose value actually differs are collected, so
+        # a no-op edit skips the UPDATE (and its commit fsync).
+        updates = []
+        params = []
+
+        if amount is not None and amount != old_amount:
+            if amount <= 0:
+                raise click.ClickException("Amount must be positive.")
+            updates.append("amount = ?")
+            params.append(amount)
+
+        if new_label is not None and new_label != old_label:
+            updates.append("label = ?")
+            params.append(new_label)
+
+        if category is not None:
+            cat_result = find_category(conn, category)
+            if not cat_result:
+                raise click.ClickException(f"Category '{category}' not found. Run 'bq cats' to see available categories.")
+            if cat_result[0] != old_cat_id:
+                updates.append("categoryId = ?")
+                params.append(cat_result[0])
+
+        if account is not None:
+            acc_result = find_account(conn, account)
+            if not acc_result:
+                raise click.ClickException(f"Account '{account}' not found. Run 'bq accs' to see available accounts.")
+            if acc_result[0] != old_acc_id:
+                updates.append("accountId = ?")
+                params.append(acc_result[0])
+
+        # Stored dates are the str() of a datetime, so the string
+        # comparison is exact; a mismatch at worst writes the same day.
+        if new_date is not None and str(new_date) != old_date:
+            updates.append("date = ?")
+            params.append(new_date)
+
+        if is_income is not None and is_income != bool(old_is_income):
+            updates.append("isIncome = ?")
+            params.append(is_income)
+
+        if not updates:
+            console.print("[dim]No changes; entry already matches.[/dim]")
+            return
+
+        updates.append("updatedAt = ?")
+        params.append(datetime.now())
+
+        params.append(record_id)
+
+        old_date_str = old_date[:10] if old_date else "-"
+        console.print(f"[dim]Was:[/dim] {old_amount:,.2f} - {old_label} [{old_cat_name or '-'}] ({old_date_str})")
+
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            # RETURNING hands back the updated row from the UPDATE
+            # itself, saving the re-read; only the category name
+            # needs a follow-up, and only when it actually changed.
+            cursor.execute(
+                f"UPDATE record SET {', '.join(updates)} WHERE id = ? "
+                "RETURNING label, amount, date, isIncome, categoryId",
+                params
+            )
+            new_label_val, new_amount, new_date_val, new_is_income, new_cat_id = cursor.fetchone()
+            if new_cat_id == old_cat_id:
+                new_cat_name = old_cat_name
+            else:
+                row = cursor.execute(
+                    "SELECT name FROM category WHERE id = ?", (new_cat_id,)
+                ).fetchone()
+                new_cat_name = row[0] if row else None
+        else:
+            cursor.execute(
+                f"UPDATE record SET {', '.join(updates)} WHERE id = ?",
+                params
+            )
+            cursor.execute(
+                """
+                SELECT r.label, r.amount, r.date, r.isIncome, c.name
+                FROM record r
+                LEFT JOIN category c ON r.categoryId = c.id
+                WHERE r.id = ?
+                """,
+                (record_id,)
+            )
+            new_label_val, new_amount, new_date_val, new_is_income, new_cat_name = cursor.fetchone()
+        new_date_str = new_date_val[:10] if new_date_val else "-"
+        record_type = "[green]Income[/green]" if new_is_income else "[red]Expense[/red]"
+
+        console.print(f"[green]Now:[/green] {record_type} {new_amount:,.2f} - {new_label_val} [{new_cat_name or '-'}] ({new_date_str})")
@@ -0,0 +1,98 @@
+"""The `bq last` command."""
+
+import sys
+
+import click
+
+from bagels_quick._core import console, emit_plain, get_connection
+
+# Amount markup templates, hoisted so the render loop doesn't rebuild
+# the f-string scaffolding per row; this is the hot loop for --all.
+_TRANSFER_TPL = "[blue]{:,.2f}[/blue]"
+_INCOME_TPL = "[green]+{:,.2f}[/green]"
+_EXPENSE_TPL = "[red]-{:,.2f}[/red]"
+
+
+def _plain_rows(cursor):
+    """Yield display tuples without markup for piped output."""
+    for date, label, amount, is_income, is_transfer, cat, acc, transfer_acc in cursor:
+        if is_transfer:
+            amount_str = f"{amount:,.2f}"
+            acc_display = f"{acc} -> {transfer_acc}"
+        elif is_income:
+            amount_str = f"+{amount:,.2f}"
+            acc_display = acc or "-"
+        else:
+            amount_str = f"-{amount:,.2f}"
+            acc_display = acc or "-"
+        yield date[:10] if date else "-", label, amount_str, cat or "-", acc_display
+
+
+@click.command()
+@click.option("-n", "--num", default=10, help="Number of records to show (default: 10)")
+@click.option("-a", "--all", "show_all", is_flag=True, help="Show all records")
+def last(num: int, show_all: bool):
+    """Show recent records.
+
+    \b
+    EXAMPLES:
+      bq last           # Last 10 records
+      bq last -n 20     # Last 20 records
+      bq last --all     # All records
+    """
+    conn = get_connection(readonly=True)
+    cursor = conn.cursor()
+    query = """
+        SELECT r.date, r.label, r.amount, r.isIncome, r.isTransfer, c.name, a.name, ta.name
+        FROM record r
+        LEFT JOIN category c ON r.categoryId = c.id
+        LEFT JOIN account a ON r.accountId = a.id
+        LEFT JOIN account ta ON r.transferToAccountId = ta.id
+        ORDER BY r.date DESC, r.createdAt DESC
+    """
+    params = ()
+    if not show_all:
+        query += " LIMIT ?"
+        params = (num,)
+
+    # Stream rows straight off the cursor instead of materializing
+    # the whole history; memory stays constant for --all.
+    cursor.arraysize = 256
+    cursor.execute(query, params)
+
+    if not sys.stdout.isatty():
+        emit_plain(_plain_rows(cursor))
+        return
+
+    from rich.table import Table
+
+    table = Table()
+    table.add_column("Date", style="dim")
+    table.add_column("Label")
+    table.add_column("Amount", justify="right")
+    table.add_column("Category", style="dim")
+    table.add_column("Account", style="dim")
+
+    count = 0
+    for date, label, amount, is_income, is_transfer, cat, acc, transfer_acc in cursor:
+        count += 1
+        date_str = date[:10] if date else "-"
+        if is_transfer:
+            amount_str = _TRANSFER_TPL.format(amount)
+            acc_display = f"{acc} -> {transfer_acc}"
+        elif is_income:
+            amount_str = _INCOME_TPL.format(amount)
+            acc_display = acc or "-"
+        else:
+            amount_str = _EXPENSE_TPL.format(amount)
+            acc_display = acc or "-"
+        table.add_row(date_str, label, amount_str, cat or "-", acc_display)
+
+    if count == 0:
+        console.print("[dim]No records found.[/dim]")
+        return
+
+    # The count isn't known until the cursor is drained, so the
+    # title is set after the fact.
+    table.title = f"Last {count} Records"
+    console.print(table)
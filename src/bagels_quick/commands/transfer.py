@@ -0,0 +1,74 @@
+"""The `bq transfer` command."""
+
+from datetime import datetime
+
+import click
+
+from bagels_quick._core import find_account, get_connection
+
+
+@click.command()
+@click.argument("amount", type=float)
+@click.argument("label")
+@click.option("--from", "-f", "from_account", required=True, help="Source account (required)")
+@click.option("--to", "-t", "to_account", required=True, help="Destination account (required)")
+@click.option("-d", "--date", "record_date", type=click.DateTime(formats=["%Y-%m-%d"]), help="Date (YYYY-MM-DD), defaults to today")
+def transfer(amount: float, label: str, from_account: str, to_account: str, record_date: datetime | None):
+    """Transfer money between accounts.
+
+    \b
+    FIELDS:
+      AMOUNT          (required)  Amount to transfer, must be > 0
+      LABEL           (required)  Description of the transfer
+
+    \b
+    OPTIONS:
+      -f, --from      (required)  Source account name
+      -t, --to        (required)  Destination account name
+      -d, --date      (optional)  Date as YYYY-MM-DD; defaults to today
+
+    \b
+    EXAMPLES:
+      bq transfer 500 "Move to savings" --from debit --to savings
+      bq transfer 1000 "Credit card payment" -f debit -t credit
+    """
+    if amount <= 0:
+        raise click.ClickException("Amount must be positive.")
+
+    conn = get_connection()
+    # Resolve from account
+    from_result = find_account(conn, from_account)
+    if not from_result:
+        raise click.ClickException(f"Source account '{from_account}' not found. Run 'bq accs' to see available accounts.")
+    from_id, from_name = from_result
+
+    # Resolve to account
+    to_result = find_account(conn, to_account)
+    if not to_result:
+        raise click.ClickException(f"Destination account '{to_account}' not found. Run 'bq accs' to see available accounts.")
+    to_id, to_name = to_result
+
+    if from_id == to_id:
+        raise click.ClickException("Source and destination accounts must be different.")
+
+    # click.DateTime already parsed -d; one now() serves createdAt,
+    # updatedAt and the default record date.
+    now = datetime.now()
+    record_date = record_date or now
+
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        INSERT INTO record (
+            createdAt, updatedAt, label, amount, date,
+            accountId, categoryId, isInProgress, isIncome, isTransfer, transferToAccountId
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (now, now, label, amount, record_date, from_id, None, False, False, True, to_id),
+    )
+    conn.commit()
+
+    click.echo(
+        f"{click.style('Transfer', fg='blue')}: {click.style(f'{amount:,.2f}', bold=True)} - {label} "
+        f"({click.style(f'{from_name} -> {to_name}', dim=True)})"
+    )
@@ -0,0 +1,112 @@
+"""The `bq undo` command."""
+
+import sqlite3
+
+import click
+
+from bagels_quick._core import get_config, get_connection
+
+# Single-statement delete of the newest record; only usable on SQLite
+# 3.35+ (RETURNING) and only when no confirmation prompt is needed,
+# since the row is gone by the time it can be shown.
+_DELETE_LAST_SQL = """
+    DELETE FROM record
+    WHERE id = (SELECT id FROM record ORDER BY createdAt DESC LIMIT 1)
+    RETURNING id, label, amount, date, isIncome, isTransfer,
+              categoryId, accountId, transferToAccountId
+"""
+
+_ENTRY_NAMES_SQL = """
+    SELECT (SELECT name FROM category WHERE id = ?),
+           (SELECT name FROM account WHERE id = ?),
+           (SELECT name FROM account WHERE id = ?)
+"""
+
+
+def _format_entry(label, amount, date, is_income, is_transfer, cat, acc, transfer_acc) -> str:
+    """Build the one-line summary shown for the entry being deleted."""
+    date_str = date[:10] if date else "-"
+    if is_transfer:
+        record_type = click.style("Transfer", fg="blue")
+        amount_str = f"{amount:,.2f}"
+        cat_display = f" ({acc} -> {transfer_acc})"
+    elif is_income:
+        record_type = click.style("Income", fg="green")
+        amount_str = f"+{amount:,.2f}"
+        cat_display = f" [{cat}]" if cat else ""
+    else:
+        record_type = click.style("Expense", fg="red")
+        amount_str = f"-{amount:,.2f}"
+        cat_display = f" [{cat}]" if cat else ""
+    return f"{record_type} {amount_str} - {label}{cat_display} ({date_str})"
+
+
+@click.command()
+@click.option("-y", "--yes", is_flag=True, help="Skip confirmation")
+def undo(yes: bool):
+    """Delete the last entry.
+
+    Shows the entry before deleting and asks for confirmation.
+
+    \b
+    EXAMPLES:
+      bq undo         # Delete last entry (with confirmation)
+      bq undo -y      # Delete without asking
+    """
+    conn = get_connection()
+    # -y already decides the question; only hit the config file when
+    # the flag wasn't given.
+    skip_confirm = yes or not get_config()["confirm_undo"]
+
+    if skip_confirm and sqlite3.sqlite_version_info >= (3, 35, 0):
+        # No prompt needed: delete and display in one atomic
+        # round-trip instead of SELECT-then-DELETE.
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute(_DELETE_LAST_SQL)
+            record = cursor.fetchone()
+            if not record:
+                click.secho("No records to delete.", dim=True)
+                return
+            _, label, amount, date, is_income, is_transfer, cat_id, acc_id, xfer_id = record
+            cursor.execute(_ENTRY_NAMES_SQL, (cat_id, acc_id, xfer_id))
+            cat, acc, transfer_acc = cursor.fetchone()
+        click.echo(
+            "Last entry: "
+            + _format_entry(label, amount, date, is_income, is_transfer, cat, acc, transfer_acc)
+        )
+        click.secho("Deleted.", fg="green")
+        return
+
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT r.id, r.label, r.amount, r.date, r.isIncome, r.isTransfer, c.name, a.name, ta.name
+        FROM record r
+        LEFT JOIN category c ON r.categoryId = c.id
+        LEFT JOIN account a ON r.accountId = a.id
+        LEFT JOIN account ta ON r.transferToAccountId = ta.id
+        ORDER BY r.createdAt DESC
+        LIMIT 1
+        """
+    )
+    record = cursor.fetchone()
+
+    if not record:
+        click.secho("No records to delete.", dim=True)
+        return
+
+    record_id, label, amount, date, is_income, is_transfer, cat, acc, transfer_acc = record
+    click.echo(
+        "Last entry: "
+        + _format_entry(label, amount, date, is_income, is_transfer, cat, acc, transfer_acc)
+    )
+
+    if not skip_confirm:
+        if not click.confirm("Delete this entry?"):
+            click.secho("Cancelled.", dim=True)
+            return
+
+    cursor.execute("DELETE FROM record WHERE id = ?", (record_id,))
+    conn.commit()
+    click.secho("Deleted.", fg="green")
@@ -0,0 +1,16 @@
+"""The `bq where` command."""
+
+import click
+
+from bagels_quick._core import CONFIG_PATH, get_db_path
+
+
+@click.command()
+def where():
+    """Show where the Bagels database is located."""
+    try:
+        db_path = get_db_path()
+        click.echo(f"Database: {click.style(str(db_path), bold=True)}")
+        click.echo(f"Config:   {click.style(str(CONFIG_PATH), bold=True)}")
+    except click.ClickException as e:
+        click.secho(e.message, fg="red")